@@ -103,12 +103,12 @@ class BaseDataset:
 		if max_pixels:
 
 			if IsIterable(max_pixels):
-				max_pixels=int(np.prod(max_pixels,dtype=np.int64))
+				max_pixels=math.prod(max_pixels)
 
 			original_box=logic_box
 			for __endh in range(maxh,0,-1):
 				aligned_box, delta, num_pixels=self.getAlignedBox(original_box,__endh, slice_dir=slice_dir)
-				tot_pixels=np.prod(num_pixels, dtype=np.int64)
+				tot_pixels=math.prod(num_pixels)
 				if tot_pixels<=max_pixels:
 					endh=__endh
 					logger.info(f"Guess resolution endh={endh} original_box={original_box} aligned_box={aligned_box} delta={delta} num_pixels={repr(num_pixels)} tot_pixels={tot_pixels:,} max_pixels={max_pixels:,} end={endh}")
@@ -4,6 +4,8 @@ from bokeh.plotting import figure
 from bokeh.models import ColorBar, LinearColorMapper, DataRange1d
 from bokeh.palettes import Turbo256  # <-- use the actual palette list
 
+from .utils import NanMinMax
+
 class RegionalSubsetting:
     def __init__(self):
         # Subset figure
@@ -57,8 +59,7 @@ class RegionalSubsetting:
             self.dh = dh
 
         # Calculate the new min and max for the data
-        new_min = np.nanmin(climate_data)
-        new_max = np.nanmax(climate_data)
+        new_min, new_max = NanMinMax(climate_data)
 
         # If this is the first set, initialize previous min/max
         if self.previous_min is None or self.previous_max is None:
@@ -1,4 +1,8 @@
-import os, sys, logging, copy, traceback, base64, asyncio, io, time, threading, json
+import os, sys, logging, copy, traceback, base64, asyncio, io, time, threading, json, zipfile
+import calendar
+import contextlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import types
 from urllib.parse import urlparse, urlencode
 from datetime import datetime, timedelta
@@ -18,14 +22,22 @@ from bokeh.models import ColumnDataSource, ColorBar, LinearColorMapper, HoverToo
 
 import param
 
-from .stats_view import StatsView
-from .regional_stats_view import RegionalStatsView
-from .regional_subsetting import RegionalSubsetting
-from .ai_insights import AIInsightsLogic
-
 from .utils   import *
 from .backend import Aborted, LoadDataset, ExecuteBoxQuery, QueryNode
 
+try:
+    import orjson  # optional: ~5x faster scene-body (de)serialization
+except ImportError:
+    orjson = None
+
+def _json_dumps(obj, indent=None):
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    return json.dumps(obj, indent=indent)
+
+def _json_loads(s):
+    return orjson.loads(s) if orjson is not None else json.loads(s)
+
 logger = logging.getLogger(__name__)
 pn.extension(
     js_files={
@@ -38,6 +50,9 @@ pn.extension(
 SLICE_ID = 0
 EPSILON = 0.001
 
+# shared across Slice instances, no need to re-allocate per session
+_SCENE_BODY_STYLESHEETS = [""".bk-input {background-color: rgb(48, 48, 64);color: white;font-size: small;}"""]
+
 # ------------------------------------------------------------
 # UI layout template (no models/scenarios; adds time_hour)
 # ------------------------------------------------------------
@@ -60,12 +75,55 @@ DEFAULT_SHOW_OPTIONS = {
 # ------------------------------------------------------------
 BASE_YEAR = 1940
 
+MONTH_ABBRS = ('Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec')
+MONTH_NUM   = {abbr: m for m, abbr in enumerate(MONTH_ABBRS, start=1)}
+
+# Precomputed at import time: raw time at hour 0 for every valid (y,m,d)
+# in the UI range, plus the day-option lists keyed by days-in-month.
+# Turns the per-widget-change datetime arithmetic into a dict lookup.
+_RAW_TIME0 = {}
+_days_since = 0
+for _y in range(BASE_YEAR, 2101):
+    for _m in range(1, 13):
+        for _d in range(1, calendar.monthrange(_y, _m)[1] + 1):
+            _RAW_TIME0[(_y, _m, _d)] = BASE_YEAR * 365 * 24 + _days_since * 24 + 1
+            _days_since += 1
+del _y, _m, _d, _days_since
+
+_DAY_OPTIONS = {n: tuple(range(1, n + 1)) for n in (28, 29, 30, 31)}
+
+# 1.3**k for k in [-32,32], indexed by k+32 (resolution delta in pushJobIfNeeded)
+_POW13 = tuple(1.3 ** k for k in range(-32, 33))
+
+# default num_refinements by point dimension (index 0 unused)
+_NUM_REFINEMENTS_BY_PDIM = (0, 1, 3, 4)
+
+def _fmt_box(b):
+    # compact [[p1],[p2]] form without the str()+replace round trip
+    return '[[' + ','.join(str(v) for v in b[0]) + '],[' + ','.join(str(v) for v in b[1]) + ']]'
+
+# cumulative days before each month in a non-leap year
+_CUM_MONTH_DAYS = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+def _leaps(y):
+    # Gregorian leap years in [1, y]
+    return y // 4 - y // 100 + y // 400
+
 def calculate_raw_time(year: int, month: int, day: int, hour: int = 0) -> int:
-    base = datetime(BASE_YEAR, 1, 1, 0, 0, 0)
-    t    = datetime(year, month, day, hour, 0, 0)
-    days_since = (t.date() - base.date()).days  # leap-aware
+    raw0 = _RAW_TIME0.get((year, month, day))
+    if raw0 is not None:
+        return raw0 + hour  # 1-based
+    # outside the precomputed UI range: closed-form leap arithmetic
+    days_since = (
+        365 * (year - BASE_YEAR)
+        + _leaps(year - 1) - _leaps(BASE_YEAR - 1)
+        + _CUM_MONTH_DAYS[month - 1]
+        + (1 if month > 2 and calendar.isleap(year) else 0)
+        + (day - 1)
+    )
     return BASE_YEAR * 365 * 24 + days_since * 24 + hour + 1  # 1-based
 
+@functools.lru_cache(maxsize=4096)
 def reverse_calculate_time(raw_time: int):
     raw0 = int(raw_time) - (BASE_YEAR * 365 * 24 + 1)
     days_since, hour = divmod(raw0, 24)
@@ -115,14 +173,14 @@ class Canvas:
             return
 
         if self.pdim==2 and [self.last_W,self.last_H]!=[W,H]:
-            x+=0.5*w
-            y+=0.5*h
-            if (w/W) > (h/H): 
-                h=w*(H/W) 
-            else: 
-                w=h*(W/H)
-            x-=0.5*w
-            y-=0.5*h
+            # aspect-ratio fix, branchless: scale both extents by the larger ratio
+            cx=x+0.5*w
+            cy=y+0.5*h
+            s=max(w/W,h/H)
+            w=s*W
+            h=s*H
+            x=cx-0.5*w
+            y=cy-0.5*h
 
         self.last_W=W
         self.last_H=H
@@ -135,11 +193,16 @@ class Canvas:
             self.fig.x_range.start, self.fig.x_range.end = x,x+w
             self.fig.y_range.start, self.fig.y_range.end = y,y+h
 
-        [fn(None) for fn in self.events[ViewportUpdate]]
+        self._dispatch(ViewportUpdate, None)
 
     def on_event(self, evt, callback):
         self.events[evt].append(callback)
 
+    def _dispatch(self, key, evt):
+        # plain loop: no throwaway list per event
+        for fn in self.events[key]:
+            fn(evt)
+
     def createFigure(self):
         old=self.fig
 
@@ -162,8 +225,8 @@ class Canvas:
         self.fig.sizing_mode = 'stretch_both'          if old is None else old.sizing_mode
         self.fig.yaxis.axis_label  = "Latitude"        if old is None else old.xaxis.axis_label
         self.fig.xaxis.axis_label  = "Longitude"       if old is None else old.yaxis.axis_label
-        self.fig.on_event(bokeh.events.Tap      , lambda evt: [fn(evt) for fn in self.events[bokeh.events.Tap      ]])
-        self.fig.on_event(bokeh.events.DoubleTap, lambda evt: [fn(evt) for fn in self.events[bokeh.events.DoubleTap]])
+        self.fig.on_event(bokeh.events.Tap      , lambda evt: self._dispatch(bokeh.events.Tap      , evt))
+        self.fig.on_event(bokeh.events.DoubleTap, lambda evt: self._dispatch(bokeh.events.DoubleTap, evt))
 
         self.fig_layout[:]=[]
         self.fig_layout.append(Bokeh(self.fig))
@@ -172,15 +235,15 @@ class Canvas:
 
     def enableSelection(self,use_python_events=False):
         if use_python_events:
-            self.fig.on_event(bokeh.events.SelectionGeometry, lambda s: print("Selection (python)"))
+            self.fig.on_event(bokeh.events.SelectionGeometry, lambda s: logger.debug("Selection (python)"))
         else:
             def handleSelectionGeometry(attr,old,new):
-                j=json.loads(new)
+                j=_json_loads(new)
                 x,y=float(j["x0"]),float(j["y0"])
                 w,h=float(j["x1"])-x,float(j["y1"])-y
                 evt=types.SimpleNamespace()
                 evt.new=[x,y,w,h]
-                [fn(evt) for fn in self.events[bokeh.events.SelectionGeometry]]
+                self._dispatch(bokeh.events.SelectionGeometry, evt)
                 logger.info(f"HandleSeletionGeometry {evt}")
 
             self.box_select_tool_helper.on_change('value', handleSelectionGeometry)
@@ -224,12 +287,13 @@ class Canvas:
         if len(data.shape)==1:
             self.pdim=1
             self.wheel_zoom_tool.dimensions="width"
-            vmin,vmax=np.nanmin(data),np.nanmax(data)
+            vmin,vmax=NanMinMax(data)
             self.fig.y_range.start=0.5*(vmin+vmax)-1.2*0.5*(vmax-vmin)
             self.fig.y_range.end  =0.5*(vmin+vmax)+1.2*0.5*(vmax-vmin)
             self.fig.renderers.clear()
-            xs=np.arange(x,x+w,w/data.shape[0])
-            ys=data
+            # float32 is plenty for pixel-space coords and halves the transport bytes
+            xs=np.linspace(x,x+w,data.shape[0],endpoint=False,dtype=np.float32)
+            ys=data.astype(np.float32,copy=False)
             self.fig.line(xs,ys)
         else:
             assert(len(data.shape) in [2,3])
@@ -237,35 +301,42 @@ class Canvas:
             self.wheel_zoom_tool.dimensions="both"
             img=ConvertDataForRendering(data)
             dtype=img.dtype
-            if all([
-                self.last_renderer.get("source",None) is not None,
-                self.last_renderer.get("dtype",None)==dtype,
-                self.last_renderer.get("color_bar",None)==color_bar
-            ]):
-                self.last_renderer["source"].data={"image":[img], "Longitude":[x], "Latitude":[y], "dw":[w], "dh":[h]}
+            if self.last_renderer.get("source",None) is not None and self.last_renderer.get("key",None)==(dtype,color_bar):
+                geom=(x,y,w,h)
+                if self.last_renderer.get("geom",None)==geom and self.last_renderer["source"].data["image"][0].shape==img.shape:
+                    # same geometry: patch only the pixels, not the coordinate columns
+                    self.last_renderer["source"].patch({"image":[(0, img)]})
+                else:
+                    self.last_renderer["source"].data={"image":[img], "Longitude":[x], "Latitude":[y], "dw":[w], "dh":[h]}
+                    self.last_renderer["geom"]=geom
             else:
-                self.createFigure()
+                # swap only the glyph renderer, keeping the figure (tools/ranges/axes) alive
+                old_glyph=self.last_renderer.get("glyph",None)
+                if old_glyph is not None:
+                    self.fig.renderers=[r for r in self.fig.renderers if r is not old_glyph]
                 source = bokeh.models.ColumnDataSource(data={"image":[img], "Longitude":[x], "Latitude":[y], "dw":[w], "dh":[h]})
-                if img.dtype==np.uint32:	
-                    self.fig.image_rgba("image", source=source, x="Longitude", y="Latitude", dw="dw", dh="dh") 
+                if img.dtype==np.uint32:
+                    glyph=self.fig.image_rgba("image", source=source, x="Longitude", y="Latitude", dw="dw", dh="dh")
                 else:
-                    self.fig.image("image", source=source, x="Longitude", y="Latitude", dw="dw", dh="dh", color_mapper=color_bar.color_mapper) 
-                self.fig.add_layout(color_bar, 'right')
+                    glyph=self.fig.image("image", source=source, x="Longitude", y="Latitude", dw="dw", dh="dh", color_mapper=color_bar.color_mapper)
+                old_color_bar=self.last_renderer.get("color_bar",None)
+                if old_color_bar is not color_bar:
+                    if old_color_bar is not None and old_color_bar in self.fig.right:
+                        self.fig.right.remove(old_color_bar)
+                    self.fig.add_layout(color_bar, 'right')
                 self.last_renderer={
                     "source": source,
-                    "dtype":img.dtype,
-                    "color_bar":color_bar
+                    "glyph": glyph,
+                    "color_bar":color_bar,
+                    "key":(dtype,color_bar),
+                    "geom":(x,y,w,h)
                 }
 
 # ------------------------------------------------------------
 class Slice(param.Parameterized):
     def __init__(self):
         super().__init__()
-        pn.extension(
-            js_files={'html2canvas': 'https://cdnjs.cloudflare.com/ajax/libs/html2canvas/1.4.1/html2canvas.min.js',
-                      'dom-to-image':'https://cdnjs.cloudflare.com/ajax/libs/dom-to-image/3.3.0/dom-to-image.min.js',
-                      'modernScreenshot': 'https://unpkg.com/modern-screenshot'}
-        )
+        # pn.extension with the screenshot js_files already ran at module import
         self.render_id = pn.widgets.IntSlider(name="RenderId", value=0)
 
         # Scene & time
@@ -273,7 +344,7 @@ class Slice(param.Parameterized):
         self.scene = pn.widgets.Select(name="Scene", options=[], width=120)
         self.timestep = pn.widgets.IntSlider(name="Time", value=0, start=0, end=1, step=1, sizing_mode="stretch_width")
         self.time_year  = pn.widgets.Select(name="Year", options=[], sizing_mode="stretch_width")
-        self.time_month = pn.widgets.Select(name="Month", options=['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec'], sizing_mode="stretch_width")
+        self.time_month = pn.widgets.Select(name="Month", options=list(MONTH_ABBRS), sizing_mode="stretch_width")
         self.time_day   = pn.widgets.Select(name="Date", options=[i for i in range(1,32)], sizing_mode="stretch_width")
         self.time_hour  = pn.widgets.Select(name="Hour", options=[i for i in range(0,24)], sizing_mode="stretch_width")
 
@@ -290,6 +361,8 @@ class Slice(param.Parameterized):
                                                      sizing_mode="stretch_width",
                                                      format=bokeh.models.formatters.NumeralTickFormatter(format="0.01"))
         self.viewport = pn.widgets.TextInput(name="Viewport", value="")
+        self.viewport_numeric = (0.0, 0.0, 0.0, 0.0)
+        self._viewport_shown = False
         self.toggle_button = pn.widgets.Button(name="Show Stats", button_type="success", width=100)
         self.region_button = pn.widgets.Button(name="Turn on Regional Setting", button_type="success", width=100)
         self.region_stats_button = pn.widgets.Button(name='Show Regional Stats', visible=False, margin=(5,10,10,50))
@@ -302,6 +375,8 @@ class Slice(param.Parameterized):
         self.range_min = pn.widgets.FloatInput(name="Min", width=80, value=0)
         self.range_max = pn.widgets.FloatInput(name="Max", width=80, value=100)
         self.palette = pn.widgets.ColorMap(name="Palette", options=GetPalettes(), value_name="Viridis", ncols=5, width=180)
+        # 256-level palette handle for the details dialog, resolved on palette change
+        self._palette256 = self.palette.value_name if self.palette.value_name.endswith("256") else DEFAULT_PALETTE
         self.color_mapper_type = pn.widgets.Select(name="Mapper", options=["linear", "log"], width=60)
 
         # Transport & misc
@@ -329,11 +404,11 @@ class Slice(param.Parameterized):
         self.insight_text = pn.widgets.TextAreaInput(value="", height=200, width=400, disabled=True, visible=False)
         self.region_checkbox = pn.widgets.Checkbox(
             name='Play Both?', visible=False, margin=(15, 10, 10, 50))
-        # Logic backends
-        self.stats_view = StatsView()
-        self.region_stats_view = RegionalStatsView()
-        self.region_view = RegionalSubsetting()
-        self.ai_insights = AIInsightsLogic()
+        # Logic backends (imported/instantiated lazily when their panel is first used)
+        self.stats_view = None
+        self.region_stats_view = None
+        self.region_view = None
+        self.ai_insights = None
 
         self.regional_setting_enabled = False
         self.ai_insights_enabled = False
@@ -347,7 +422,7 @@ class Slice(param.Parameterized):
             else:
                 self.stats_panel.visible = True
                 self.toggle_button.name = "Hide Stats"
-                self.stats_panel[:] = [self.stats_view.get_view()]
+                self.stats_panel[:] = [self.getStatsView().get_view()]
         self.toggle_button.on_click(toggle_stats)
 
         def toggle_regional_stats(event):
@@ -358,12 +433,12 @@ class Slice(param.Parameterized):
             else:
                 self.region_stats_panel.visible = True
                 self.region_stats_button.name = "Hide Regional Stats"
-                self.region_stats_panel[:] = [self.region_stats_view.get_view()]
+                self.region_stats_panel[:] = [self.getRegionStatsView().get_view()]
         self.region_stats_button.on_click(toggle_regional_stats)
 
         def toggle_ai_insights(event):
             if self.generate_insights_button.name == "Turn on AI Insights":
-                insights = self.ai_insights.generate_insights()
+                insights = self.getAIInsights().generate_insights()
                 self.insight_text.value = insights
                 self.insight_text.visible = True
                 self.generate_insights_button.name = "Turn off AI Insights"
@@ -374,7 +449,6 @@ class Slice(param.Parameterized):
                 self.generate_insights_button.name = "Turn on AI Insights"
                 self.generate_insights_button.button_type = "success"
                 self.ai_insights_enabled = False
-            self.main_layout[1] = self.build_middle_layout()
         self.generate_insights_button.on_click(toggle_ai_insights)
         def toggle_region(event):
             if self.regional_setting_enabled:
@@ -398,10 +472,10 @@ class Slice(param.Parameterized):
                 self.region_button.button_type = "danger"
 
         # (Re)attach the subsetting view
-                self.region_panel[:] = [self.region_view.get_view()]
+                self.region_panel[:] = [self.getRegionView().get_view()]
 
-    # Recompose the center of the page to include/exclude the right column
-            self.main_layout[1] = self.build_middle_layout()
+    # Show/hide the right column without rebuilding the middle section
+            self._region_slot.visible = self.regional_setting_enabled
 
 
         self.region_button.on_click(toggle_region)
@@ -410,7 +484,10 @@ class Slice(param.Parameterized):
 
         # Palette/Range callbacks
         def onPaletteChange(evt):
-            self.color_bar=None
+            self._palette256 = evt.new if evt.new.endswith("256") else DEFAULT_PALETTE
+            if self.color_bar is not None:
+                # retarget the live mapper; keeps the renderer and ColorBar models
+                self.color_bar.color_mapper.palette=self.palette.value
             self.refresh()
         self.palette.param.watch(SafeCallback(onPaletteChange),"value_name", onlychanged=True,queued=True)
 
@@ -430,7 +507,8 @@ class Slice(param.Parameterized):
 
         def onRangeChange(evt):
             self.color_map=None
-            self.color_bar=None
+            # gotNewData writes the new low/high onto the live mapper; the
+            # ColorBar only needs rebuilding when the mapper type changes
             self.refresh()
         self.range_min.param.watch(SafeCallback(onRangeChange),"value", onlychanged=True,queued=True)
         self.range_max.param.watch(SafeCallback(onRangeChange),"value", onlychanged=True,queued=True)
@@ -450,7 +528,7 @@ class Slice(param.Parameterized):
             logger.debug(f"id={self.id} value={value}")
             pdim = self.getPointDim()
             if pdim in (1,2): value = 2
-            dims = [int(it) for it in self.db.getLogicSize()]
+            dims = list(self._logic_size)
             offset_value,offset_range=self.guessOffset(value)
             self.offset.start=offset_range[0]
             self.offset.end  =offset_range[1]
@@ -463,47 +541,60 @@ class Slice(param.Parameterized):
         self.offset.param.watch(SafeCallback(lambda evt: self.refresh()),"value", onlychanged=True,queued=True)
 
         # Time wiring: slider <-> (Y/M/D/H)
+        # the slider and the four widgets write each other, so a plain
+        # reentrancy guard stops the callbacks from ping-ponging
+        self._syncing_time_widgets = False
+
         def onTimestepChange(evt):
-            y, m, d, h, _ = reverse_calculate_time(self.timestep.value)
-            self.time_year.value  = y
-            self.time_month.value = datetime(2000, m, 1).strftime("%b")
-            self.time_day.value   = d
-            self.time_hour.value  = h
+            if self._syncing_time_widgets:
+                return
+            with self._sync_time_widgets():
+                y, m, d, h, _ = reverse_calculate_time(self.timestep.value)
+                self.time_year.value  = y
+                self.time_month.value = MONTH_ABBRS[m-1]
+                _update_day_options_for_year_month()
+                self.time_day.value   = d
+                self.time_hour.value  = h
             self.refresh()
         self.timestep.param.watch(SafeCallback(onTimestepChange), "value", onlychanged=True, queued=True)
 
         def _recalc_timestep_from_widgets():
-            mnum = datetime.strptime(self.time_month.value, "%b").month
+            if self._syncing_time_widgets:
+                return
+            mnum = MONTH_NUM[self.time_month.value]
             self.timestep.value = calculate_raw_time(self.time_year.value, mnum, self.time_day.value, self.time_hour.value)
 
         # --- Leap-aware days in month: Feb 29 support ---
         def _update_day_options_for_year_month():
-            sel_month_num = datetime.strptime(self.time_month.value, "%b").month
-            if sel_month_num == 12:
-                next_month = datetime(self.time_year.value + 1, 1, 1)
-            else:
-                next_month = datetime(self.time_year.value, sel_month_num + 1, 1)
-            this_month = datetime(self.time_year.value, sel_month_num, 1)
-            days_in_month = (next_month - this_month).days
-            self.time_day.options = list(range(1, days_in_month + 1))
+            sel_month_num = MONTH_NUM[self.time_month.value]
+            days_in_month = calendar.monthrange(self.time_year.value, sel_month_num)[1]
+            self.time_day.options = list(_DAY_OPTIONS[days_in_month])
             if self.time_day.value > days_in_month:
                 self.time_day.value = days_in_month
 
         def onMonthChange(evt):
+            if self._syncing_time_widgets:
+                return
             _update_day_options_for_year_month()
             _recalc_timestep_from_widgets(); self.refresh()
         self.time_month.param.watch(SafeCallback(onMonthChange), "value", onlychanged=True, queued=True)
 
         def onYearChange(evt):
+            if self._syncing_time_widgets:
+                return
             _update_day_options_for_year_month()
             _recalc_timestep_from_widgets(); self.refresh()
         self.time_year.param.watch(SafeCallback(onYearChange), "value", onlychanged=True, queued=True)
 
         def onDayChange(evt):
+            if self._syncing_time_widgets:
+                return
             _recalc_timestep_from_widgets(); self.refresh()
         self.time_day.param.watch(SafeCallback(onDayChange), "value", onlychanged=True, queued=True)
 
         def onHourChange(evt):
+            if self._syncing_time_widgets:
+                return
             _recalc_timestep_from_widgets(); self.refresh()
         self.time_hour.param.watch(SafeCallback(onHourChange), "value", onlychanged=True, queued=True)
 
@@ -524,15 +615,40 @@ class Slice(param.Parameterized):
 	
         self.db = None
         self.access = None
+        self._details_access = None
+        # single-worker queue so disk writes never block the server loop
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        # immutable per-dataset geometry, cached in setSceneBody
+        self._logic_size = None
+        self._physic_box_cached = None
+        self._axis_table = None
+        self._pdim = None
+        self._scene_url_cache = (None, None)
+        self._to_physic_cache = (None, None)
+        self._last_query_key = None
+        self._last_scene_body_id = None
+        self._scene_body_watched = False
+        self._disableable = None
+        self._maxres = None
+        self._show_options_cache = (None, None)
+        self._frame_flip_buf = None
+        self._play_interval_ns = 0
+        self._push_kwargs = {
+            'access': None, 'timestep': 0, 'field': '', 'logic_box': None,
+            'max_pixels': None, 'num_refinements': 1, 'endh': None, 'aborted': None,
+        }
         self.detailed_data=None
         self.selected_physic_box=None
         self.selected_logic_box=None
+        self._sel_ix=None
 
         self.logic_to_physic        = [(0.0, 1.0)] * 3
+        self._lp_vt                 = np.zeros(3, dtype=np.float64)
+        self._lp_vs                 = np.ones (3, dtype=np.float64)
         self.metadata_range         = [0.0, 255.0]
         self.scenes                 = {}
 
-        self.scene_body.stylesheets=[""".bk-input {background-color: rgb(48, 48, 64);color: white;font-size: small;}"""]
+        self.scene_body.stylesheets=_SCENE_BODY_STYLESHEETS
 
         self.createGui()
 
@@ -544,18 +660,51 @@ class Slice(param.Parameterized):
 
     # ----- Layout helpers -----
     def build_middle_layout(self):
-        if self.regional_setting_enabled:
-            return Row(
-                Column(self.middle_layout, self.stats_panel),
-                Column(self.region_panel, self.region_stats_panel)
-            )
-        elif self.ai_insights_enabled:
-            return Column(self.middle_layout, self.stats_panel, self.insight_text)
-        else:
-            return Column(self.middle_layout, self.stats_panel)
+        # built once: toggles just flip `visible` on the persistent slots
+        # instead of streaming a brand-new layout tree to BokehJS
+        if getattr(self, "_middle_row", None) is None:
+            self._center_slot = Column(self.middle_layout, self.stats_panel, self.insight_text, sizing_mode="stretch_both")
+            self._region_slot = Column(self.region_panel, self.region_stats_panel, sizing_mode="stretch_both", visible=False)
+            self._middle_row  = Row(self._center_slot, self._region_slot, sizing_mode="stretch_both")
+        return self._middle_row
 
     def update_layout(self, event):
-        self.main_layout[1] = self.build_middle_layout()
+        self._region_slot.visible = self.regional_setting_enabled
+
+    # ----- Lazy view construction -----
+    # imports deferred so a session that never opens these panels
+    # does not pay their import/Bokeh-model cost
+    def getStatsView(self):
+        if self.stats_view is None:
+            from .stats_view import StatsView
+            self.stats_view = StatsView()
+        return self.stats_view
+
+    def getRegionStatsView(self):
+        if self.region_stats_view is None:
+            from .regional_stats_view import RegionalStatsView
+            self.region_stats_view = RegionalStatsView()
+        return self.region_stats_view
+
+    def getRegionView(self):
+        if self.region_view is None:
+            from .regional_subsetting import RegionalSubsetting
+            self.region_view = RegionalSubsetting()
+        return self.region_view
+
+    def getAIInsights(self):
+        if self.ai_insights is None:
+            from .ai_insights import AIInsightsLogic
+            self.ai_insights = AIInsightsLogic()
+        return self.ai_insights
+
+    @contextlib.contextmanager
+    def _sync_time_widgets(self):
+        self._syncing_time_widgets = True
+        try:
+            yield
+        finally:
+            self._syncing_time_widgets = False
 
     # ----- Create GUI skeleton -----
     def createGui(self):
@@ -627,7 +776,7 @@ class Slice(param.Parameterized):
         self.aborted       = Aborted()
         self.new_job       = True
         self.current_img   = None
-        self.last_job_pushed = time.time()
+        self.last_job_pushed_ns = time.monotonic_ns()
 
         self.canvas = Canvas(self.id)
         self.canvas.on_event(ViewportUpdate,              SafeCallback(self.onCanvasViewportChange))
@@ -652,6 +801,52 @@ class Slice(param.Parameterized):
             sizing_mode="stretch_both"
         )
 
+        # persistent details-dialog models, reused across selections so each
+        # drag-select only updates data/ranges instead of registering a fresh
+        # figure, mapper, color bar and seven buttons
+        self._detail_mapper = LinearColorMapper(palette=DEFAULT_PALETTE, low=0, high=1)
+        self._detail_source = ColumnDataSource(data=dict(image=[np.zeros((1,1),dtype=np.float32)], x=[0.0], y=[0.0], dw=[1.0], dh=[1.0]))
+        self._detail_fig = figure(x_range=(0,1), y_range=(0,1))
+        self._detail_fig.image(image='image', x='x', y='y', dw='dw', dh='dh',
+                               color_mapper=self._detail_mapper, source=self._detail_source)
+        self._detail_fig.add_layout(ColorBar(color_mapper=self._detail_mapper, label_standoff=12, location=(0,0)), 'right')
+        self._detail_fig.xaxis.axis_label = "Longitude"
+        self._detail_fig.yaxis.axis_label = "Latitude"
+        self._detail_palette_md = pn.pane.Markdown("")
+        self._detail_minmax_md  = pn.pane.Markdown("")
+        self._detail_image_buf  = None
+
+        self.save_numpy_button             = pn.widgets.Button(name='Save Data as Numpy', button_type='primary')
+        self.download_script_button        = pn.widgets.Button(name='Download Script', button_type='primary')
+        self.apply_colormap_button         = pn.widgets.Button(name='Replace Existing Range', button_type='primary')
+        self.apply_min_colormap_button     = pn.widgets.Button(name='Replace Min Range', button_type='primary')
+        self.apply_max_colormap_button     = pn.widgets.Button(name='Replace Max Range', button_type='primary')
+        self.apply_avg_min_colormap_button = pn.widgets.Button(name='Apply Average Min', button_type='primary')
+        self.apply_avg_max_colormap_button = pn.widgets.Button(name='Apply Average Max', button_type='primary')
+        self.add_range_button              = pn.widgets.Button(name='Add This Range', button_type='primary')
+
+        self.save_numpy_button.on_click(self.save_data)
+        self.download_script_button.on_click(self.download_script)
+        self.apply_colormap_button.on_click(self.apply_cmap)
+        self.apply_max_colormap_button.on_click(self.apply_max_cmap)
+        self.apply_min_colormap_button.on_click(self.apply_min_cmap)
+        self.apply_avg_max_colormap_button.on_click(self.apply_avg_max_cmap)
+        self.apply_avg_min_colormap_button.on_click(self.apply_avg_min_cmap)
+        self.add_range_button.on_click(self.add_range)
+
+        self._detail_layout = pn.Column(
+            self.file_name_input,
+            pn.Row(self.save_numpy_button, self.download_script_button),
+            pn.Row(pn.pane.Bokeh(self._detail_fig), pn.Column(
+                self._detail_palette_md,
+                pn.pane.Markdown(f"#### New Min/Max Found"),
+                self._detail_minmax_md,
+                pn.Row(self.apply_avg_min_colormap_button, self.apply_avg_max_colormap_button),
+                self.add_range_button,
+                self.apply_colormap_button)),
+            sizing_mode="stretch_both"
+        )
+
         self.setShowOptions(DEFAULT_SHOW_OPTIONS)
         self.canvas.on_event(bokeh.events.SelectionGeometry, SafeCallback(self.showDetails))
         self.start()
@@ -659,7 +854,15 @@ class Slice(param.Parameterized):
     # ----- Misc UI plumbing -----
     def onCanvasViewportChange(self, evt):
         x,y,w,h=self.canvas.getViewport()
-        self.viewport.value=f"{x} {y} {w} {h}"
+        # numeric publish: pan/zoom storms should not pay per-event string
+        # formatting for a widget that is usually not even shown
+        vp=(float(x),float(y),float(w),float(h))
+        if vp==self.viewport_numeric:
+            # paired x/y range updates fire twice for the same viewport
+            return
+        self.viewport_numeric=vp
+        if self._viewport_shown:
+            self.viewport.value=f"{x} {y} {w} {h}"
         self.refresh()
 
     def onCanvasSingleTap(self, evt): pass
@@ -670,20 +873,40 @@ class Slice(param.Parameterized):
 
     def setShowOptions(self, value):
         self.show_options=value
+        self._viewport_shown = any("viewport" in row for rows in value.values() for row in rows)
+        # the name->widget resolution is fixed for a given options dict:
+        # resolve once and reuse on later layout rebuilds
+        cached_value, resolved = self._show_options_cache
+        if value is not cached_value:
+            resolved={}
+            for position in ("top","bottom"):
+                rows=[]
+                for row in value.get(position,[[]]):
+                    v=[]
+                    for widget in row:
+                        if isinstance(widget,str):
+                            widget=getattr(self, widget.replace("-","_"),None)
+                        if widget:
+                            v.append(widget)
+                    if v: rows.append(v)
+                resolved[position]=rows
+            self._show_options_cache=(value, resolved)
         for layout, position in ((self.top_layout,"top"),(self.bottom_layout,"bottom")):
             layout.clear()
-            for row in value.get(position,[[]]):
-                v=[]
-                for widget in row:
-                    if isinstance(widget,str):
-                        widget=getattr(self, widget.replace("-","_"),None)
-                    if widget:
-                        v.append(widget)
-                if v: layout.append(Row(*v,sizing_mode="stretch_width"))
+            for v in resolved[position]:
+                layout.append(Row(*v,sizing_mode="stretch_width"))
+
+    def _encodeSceneLoad(self, body_s):
+        # base64 of an unchanged scene is pure waste: memoize on the JSON text
+        cached_body, cached_load = self._scene_url_cache
+        if body_s==cached_body:
+            return cached_load
+        load_s=base64.b64encode(body_s.encode('utf-8')).decode('ascii')
+        self._scene_url_cache=(body_s, load_s)
+        return load_s
 
     def getShareableUrl(self):
-        body=self.getSceneBody()
-        load_s=base64.b64encode(json.dumps(body).encode('utf-8')).decode('ascii')
+        load_s=self._encodeSceneLoad(_json_dumps(self.getSceneBody()))
         current_url=GetCurrentUrl()
         o=urlparse(current_url)
         return o.scheme + "://" + o.netloc + o.path + '?' + urlencode({'load': load_s})
@@ -709,22 +932,28 @@ class Slice(param.Parameterized):
     def setLogicToPhysic(self, value):
         logger.debug(f"id={self.id} value={value}")
         self.logic_to_physic = value
+        # precomputed affine coefficients for toPhysic/toLogic
+        self._lp_vt = np.array([it[0] for it in value], dtype=np.float64)
+        self._lp_vs = np.array([it[1] for it in value], dtype=np.float64)
+        self._physic_box_cached = None
         self.refresh()
 
     def getPhysicBox(self):
-        dims = self.db.getLogicSize()
+        if self._physic_box_cached is not None:
+            return self._physic_box_cached
+        dims = self._logic_size if self._logic_size is not None else self.db.getLogicSize()
         vt = [it[0] for it in self.logic_to_physic]
         vs = [it[1] for it in self.logic_to_physic]
-        return [[0 * vs[I] + vt[I], dims[I] * vs[I] + vt[I]] for I in range(len(dims))]
+        self._physic_box_cached = [[0 * vs[I] + vt[I], dims[I] * vs[I] + vt[I]] for I in range(len(dims))]
+        return self._physic_box_cached
 
     def setPhysicBox(self, value):
-        dims = self.db.getLogicSize()
-        def LinearMapping(a, b, A, B):
-            vs = (B - A) / (b - a)
-            vt = A - a * vs
-            return vt, vs
-        T = [LinearMapping(0, dims[I], *value[I]) for I in range(len(dims))]
-        self.setLogicToPhysic(T)
+        dims = np.asarray(self._logic_size if self._logic_size is not None else self.db.getLogicSize(), dtype=np.float64)
+        bounds = np.asarray(value, dtype=np.float64)
+        # linear mapping logic [0,dims] -> physic [A,B] for all dims at once
+        vs = (bounds[:, 1] - bounds[:, 0]) / dims
+        vt = bounds[:, 0]
+        self.setLogicToPhysic(list(zip(vt.tolist(), vs.tolist())))
 		
     def getSceneBody(self):
         return {
@@ -749,10 +978,18 @@ class Slice(param.Parameterized):
         }
 
     def hold(self):
-        self.num_hold=getattr(self,"num_hold",0) + 1
+        self.num_hold+=1
+        if self.num_hold==1:
+            doc=pn.state.curdoc
+            if doc is not None:
+                doc.hold("combine")
 
     def unhold(self):
         self.num_hold-=1
+        if self.num_hold==0:
+            doc=pn.state.curdoc
+            if doc is not None and doc.callbacks.hold_value:
+                doc.unhold()
 
     # ----- Scene load -----
     def load(self, value):
@@ -782,6 +1019,16 @@ class Slice(param.Parameterized):
             self.setSceneBody(self.scenes[first_scene_name])
 
     def setSceneBody(self, scene):
+        # a scene load drives dozens of widget writes, each with watchers that
+        # call refresh(); hold the document so they reach BokehJS as one patch
+        # (refresh itself only sets flags consumed by the 30Hz idle loop)
+        self.hold()
+        try:
+            self._setSceneBody(scene)
+        finally:
+            self.unhold()
+
+    def _setSceneBody(self, scene):
         logger.info(f"# //////////////////////////////////////////#")
         logger.info(f"id={self.id} {scene} START")
 
@@ -802,10 +1049,17 @@ class Slice(param.Parameterized):
                 url = locals_[0]["url"]
 
         logger.info(f"id={self.id} LoadDataset url={url}...")
-        db=LoadDataset(url=url) 
+        db=LoadDataset(url=url)
         self.data_url=url
         self.db    = db
+        self._logic_size = tuple(int(it) for it in db.getLogicSize())
+        self._physic_box_cached = None
+        self._pdim = db.getPointDim()
+        self._maxres = db.getMaxResolution()
         self.access=db.createAccess()
+        # the query node owns self.access on its worker thread; the details
+        # dialog queries synchronously, so give it its own access object
+        self._details_access=db.createAccess()
         self.scene.value=name
 
         # Fixed field
@@ -813,14 +1067,15 @@ class Slice(param.Parameterized):
         db_field = self.db.getField(self.field.value)
         self.metadata_range = [db_field.getDTypeRange().From, db_field.getDTypeRange().To]
 
-        # Timesteps: use full dataset range
-        all_timesteps=self.db.getTimesteps()
-        self.timestep.start = int(all_timesteps[0])
-        self.timestep.end   = int(all_timesteps[-1])
+        # Timesteps: use full dataset range, fetched once per dataset
+        # (getTimesteps() may traverse metadata)
+        self._all_timesteps = all_timesteps = [int(it) for it in self.db.getTimesteps()]
+        self.timestep.start = all_timesteps[0]
+        self.timestep.end   = all_timesteps[-1]
         self.timestep.step  = 1
 
         # Initialize Y/M/D/H from current timestep
-        init_ts = int(scene.get("timestep", self.db.getTimesteps()[0]))
+        init_ts = int(scene.get("timestep", all_timesteps[0]))
         y, m, d, h, _ = reverse_calculate_time(init_ts)
 
         # Year range derived from dataset bounds
@@ -829,18 +1084,13 @@ class Slice(param.Parameterized):
         self.time_year.options = list(range(y0, y1+1))
 
         self.time_year.value  = y
-        self.time_month.value = datetime(2000, m, 1).strftime("%b")
+        self.time_month.value = MONTH_ABBRS[m-1]
 
         # Clamp day options for month/year (leap-aware)
         def _update_day_options_for_year_month():
-            sel_month_num = datetime.strptime(self.time_month.value, "%b").month
-            if sel_month_num == 12:
-                next_month = datetime(self.time_year.value + 1, 1, 1)
-            else:
-                next_month = datetime(self.time_year.value, sel_month_num + 1, 1)
-            this_month = datetime(self.time_year.value, sel_month_num, 1)
-            days_in_month = (next_month - this_month).days
-            self.time_day.options = list(range(1, days_in_month + 1))
+            sel_month_num = MONTH_NUM[self.time_month.value]
+            days_in_month = calendar.monthrange(self.time_year.value, sel_month_num)[1]
+            self.time_day.options = list(_DAY_OPTIONS[days_in_month])
             if self.time_day.value > days_in_month:
                 self.time_day.value = days_in_month
 
@@ -863,14 +1113,15 @@ class Slice(param.Parameterized):
         directions = self.db.inner.idxfile.axis.strip().split()
         directions = {it: I for I, it in enumerate(directions)} if directions else  {'X':0,'Y':1,'Z':2}
         self.direction.options=directions
+        self._buildAxisTable()
 
         # Other scene params
         self.timestep_delta.value=int(scene.get("timestep-delta", 1))
         self.view_dependent.value = bool(scene.get('view-dependent', True))
 
         resolution=int(scene.get("resolution", -6))
-        if resolution<0: resolution=self.db.getMaxResolution()+resolution
-        self.resolution.end = self.db.getMaxResolution()
+        if resolution<0: resolution=self._maxres+resolution
+        self.resolution.end = self._maxres
         self.resolution.value = resolution
 
         self.range_mode.value="user"
@@ -885,7 +1136,7 @@ class Slice(param.Parameterized):
         self.offset.end  =offset_range[1]
         self.offset.step=1e-16 if self.offset.editable and offset_range[2]==0.0 else offset_range[2]
         self.offset.value=float(scene.get("offset",default_offset_value))
-        self.setQueryLogicBox(([0]*self.getPointDim(),[int(it) for it in self.db.getLogicSize()]))
+        self.setQueryLogicBox(([0]*self.getPointDim(),list(self._logic_size)))
 
         self.play_sec.value=float(scene.get("play-sec",0.01))
         self.palette.value_name=scene.get("palette",DEFAULT_PALETTE)
@@ -926,6 +1177,10 @@ class Slice(param.Parameterized):
         self.showDialog(*cards)
 
     def showOpen(self):
+        # from now on pushJobIfNeeded keeps the widget current; seed it here
+        self._scene_body_watched=True
+        self.scene_body.value=_json_dumps(self.getSceneBody(),indent=2)
+
         def onLoadClick(evt):
             body=evt.new.decode('ascii') if evt.new else ""
             self.scene_body.value=body
@@ -934,7 +1189,7 @@ class Slice(param.Parameterized):
         file_input.param.watch(SafeCallback(onLoadClick),"value", onlychanged=True,queued=True)
 
         def onEvalClick(evt):
-            self.setSceneBody(json.loads(self.scene_body.value))
+            self.setSceneBody(_json_loads(self.scene_body.value))
             ShowInfoNotification('Eval done')
         eval_button = pn.widgets.Button(name="Eval", align='end')
         eval_button.on_click(SafeCallback(onEvalClick))
@@ -948,14 +1203,29 @@ class Slice(param.Parameterized):
             width=600, height=700, name="Open")
 
     def save(self):
-        body=json.dumps(self.getSceneBody(),indent=2)
+        body=_json_dumps(self.getSceneBody(),indent=2)
         self.save_button_helper.value=body
         ShowInfoNotification('Save done')
-        print(body)
+        logger.debug("saved scene body %s", body)
 
     def copyUrl(self):
-        self.copy_url_button_helper.value=self.getShareableUrl()
-        ShowInfoNotification('Copy url done')
+        # serialize+encode off the UI thread; big scene bodies otherwise
+        # block the Panel server while the button is pressed
+        body=self.getSceneBody()
+        current_url=GetCurrentUrl()
+        doc=pn.state.curdoc
+        def _encode():
+            load_s=self._encodeSceneLoad(_json_dumps(body))
+            o=urlparse(current_url)
+            url=o.scheme + "://" + o.netloc + o.path + '?' + urlencode({'load': load_s})
+            def _publish():
+                self.copy_url_button_helper.value=url
+                ShowInfoNotification('Copy url done')
+            if doc is not None:
+                doc.add_next_tick_callback(_publish)
+            else:
+                _publish()
+        self._io_pool.submit(_encode)
 
     def takeScreenshot(self):
         self.take_screenshot_button_helper.value=""
@@ -970,35 +1240,44 @@ class Slice(param.Parameterized):
 
     # ----- Dataset helpers -----
     def getMaxResolution(self):
-        return self.db.getMaxResolution()
+        return self._maxres if self._maxres is not None else self.db.getMaxResolution()
 
     def setViewDependent(self, value):
         logger.debug(f"id={self.id} value={value}")
         self.view_dependent.value = value
         self.refresh()
 
-    def getLogicAxis(self):
-        dir  = self.direction.value
+    def _buildAxisTable(self):
+        # getLogicAxis runs on every frame: precompute the three possible
+        # permutations whenever the direction options change
         directions = self.direction.options
-        XY = list(directions.values())
-        if len(XY) == 3:
-            del XY[dir]
-        else:
-            assert (len(XY) == 2)
-        X, Y = XY
-        Z = dir if len(directions) == 3 else 2
         titles = list(directions.keys())
-        return (X, Y, Z), (titles[X], titles[Y], titles[Z] if len(titles) == 3 else 'Z')
+        values = list(directions.values())
+        assert (len(values) in [2, 3])
+        table = {}
+        for dir in (0, 1, 2):
+            XY = list(values)
+            if len(XY) == 3:
+                del XY[dir]
+            X, Y = XY
+            Z = dir if len(values) == 3 else 2
+            table[dir] = ((X, Y, Z), (titles[X], titles[Y], titles[Z] if len(titles) == 3 else 'Z'))
+        self._axis_table = table
+
+    def getLogicAxis(self):
+        if self._axis_table is None:
+            self._buildAxisTable()
+        return self._axis_table[self.direction.value]
 
     def guessOffset(self, dir):
         pdim = self.getPointDim()
         if pdim<=2:
             return 0, [0, 0, 1]
         else:
-            vt = [self.logic_to_physic[I][0] for I in range(pdim)]
-            vs = [self.logic_to_physic[I][1] for I in range(pdim)]
-            if all([it == 0 for it in vt]) and all([it == 1.0 for it in vs]):
-                dims = [int(it) for it in self.db.getLogicSize()]
+            vt = self._lp_vt[:pdim]
+            vs = self._lp_vs[:pdim]
+            if not vt.any() and (vs == 1.0).all():
+                dims = list(self._logic_size)
                 value = dims[dir] // 2
                 return value,[0, int(dims[dir]) - 1, 1]
             else:
@@ -1009,11 +1288,10 @@ class Slice(param.Parameterized):
     def toPhysic(self, value):
         dir = self.direction.value
         pdim = self.getPointDim()
-        vt = [self.logic_to_physic[I][0] for I in range(pdim)]
-        vs = [self.logic_to_physic[I][1] for I in range(pdim)]
-        p1,p2=value
-        p1 = [vs[I] * p1[I] + vt[I] for I in range(pdim)]
-        p2 = [vs[I] * p2[I] + vt[I] for I in range(pdim)]
+        vt = self._lp_vt[:pdim]
+        vs = self._lp_vs[:pdim]
+        p = np.asarray(value, dtype=np.float64) * vs + vt
+        p1, p2 = p[0].tolist(), p[1].tolist()
         if pdim==1:
             p1.append(0.0); p2.append(1.0)
         elif pdim==3:
@@ -1021,11 +1299,19 @@ class Slice(param.Parameterized):
         x1,y1=p1; x2,y2=p2
         return [x1,y1, x2-x1, y2-y1]
 
+    def _cachedToPhysic(self, logic_box):
+        # 1-slot cache: refinements of the same query deliver the same box
+        key=(self.direction.value, id(self._lp_vt), tuple(map(tuple, logic_box)))
+        cached_key, cached_value = self._to_physic_cache
+        if key==cached_key:
+            return cached_value
+        value=self.toPhysic(logic_box)
+        self._to_physic_cache=(key, value)
+        return value
+
     def toLogic(self, value):
         pdim = self.getPointDim()
         dir = self.direction.value
-        vt = [self.logic_to_physic[I][0] for I in range(pdim)]
-        vs = [self.logic_to_physic[I][1] for I in range(pdim)]
         x,y,w,h=value
         p1=[x  ,y  ]
         p2=[x+w,y+h]
@@ -1034,11 +1320,13 @@ class Slice(param.Parameterized):
         elif pdim==3:
             p1.insert(dir, 0)
             p2.insert(dir, 0)
-        p1 = [(p1[I] - vt[I]) / vs[I] for I in range(pdim)]
-        p2 = [(p2[I] - vt[I]) / vs[I] for I in range(pdim)]
+        vt = self._lp_vt[:pdim]
+        vs = self._lp_vs[:pdim]
+        p = (np.array([p1, p2], dtype=np.float64) - vt) / vs
+        p1, p2 = p[0].tolist(), p[1].tolist()
         if pdim == 3:
             p1[dir] = int((self.offset.value  - vt[dir]) / vs[dir])
-            p2[dir] = p1[dir]+1 
+            p2[dir] = p1[dir]+1
         return [p1, p2]
 
     # ----- Playback -----
@@ -1056,7 +1344,8 @@ class Slice(param.Parameterized):
         if self.region_checkbox.value:
             self.view_dependent.value=False
             self.resolution.value=21
-        self.play.t1 = time.time()
+        self.play.t1 = time.monotonic_ns()
+        self._play_interval_ns = int(float(self.play_sec.value) * 1_000_000_000)
         self.play.wait_render_id = None
         self.play.num_refinements = self.num_refinements.value
         self.num_refinements.value = 1
@@ -1074,10 +1363,9 @@ class Slice(param.Parameterized):
         self.play_button.name = "Play"
 
     def playNextIfNeeded(self):
-        if not self.play.is_playing:
-            return
-        t2 = time.time()
-        if (t2 - self.play.t1) < float(self.play_sec.value):
+        # caller (onIdle) guarantees play.is_playing
+        # integer compare against the interval snapshot taken in startPlay
+        if (time.monotonic_ns() - self.play.t1) < self._play_interval_ns:
             return
         if self.play.wait_render_id is not None and self.render_id.value<self.play.wait_render_id:
             return
@@ -1085,30 +1373,30 @@ class Slice(param.Parameterized):
         if T >= self.timestep.end:
             T = self.timestep.start
         self.play.wait_render_id = self.render_id.value+1
-        self.play.t1 = time.time()
+        self.play.t1 = time.monotonic_ns()
         self.timestep.value= T
 
     def onShowMetadataClick(self):
         self.metadata.visible = not self.metadata.visible
 
     def setWidgetsDisabled(self, value):
-        self.scene.disabled = value
-        self.palette.disabled = value
-        self.timestep.disabled = value
-        self.timestep_delta.disabled = value
-        self.field.disabled = value
-        self.direction.disabled = value
-        self.offset.disabled = value
-        self.num_refinements.disabled = value
-        self.resolution.disabled = value
-        self.view_dependent.disabled = value
-        self.request.disabled = value
-        self.response.disabled = value
-        self.play_button.disabled = value
-        self.play_sec.disabled = value
+        if self._disableable is None:
+            self._disableable = (
+                self.scene, self.palette, self.timestep, self.timestep_delta,
+                self.field, self.direction, self.offset, self.num_refinements,
+                self.resolution, self.view_dependent, self.request, self.response,
+                self.play_button, self.play_sec,
+            )
+        # one combined document event instead of one per widget
+        self.hold()
+        try:
+            for w in self._disableable:
+                w.disabled = value
+        finally:
+            self.unhold()
 
     def getPointDim(self):
-        return self.db.getPointDim() if self.db else 2
+        return self._pdim if self.db else 2
 
     # ----- Query orchestration -----
     def refresh(self):
@@ -1125,48 +1413,79 @@ class Slice(param.Parameterized):
         self.refresh()
 
     def getLogicCenter(self):
-        pdim=self.getPointDim()  
         p1,p2=self.getQueryLogicBox()
-        assert(len(p1)==pdim and len(p2)==pdim)
-        return [(p1[I]+p2[I])*0.5 for I in range(pdim)]
+        if len(p1)==2:
+            return ((p1[0]+p2[0])*0.5,(p1[1]+p2[1])*0.5)
+        return ((p1[0]+p2[0])*0.5,(p1[1]+p2[1])*0.5,(p1[2]+p2[2])*0.5)
 
     def getLogicSize(self):
-        pdim=self.getPointDim()
         p1,p2=self.getQueryLogicBox()
-        assert(len(p1)==pdim and len(p2)==pdim)
-        return [(p2[I]-p1[I]) for I in range(pdim)]
+        if len(p1)==2:
+            return (p2[0]-p1[0],p2[1]-p1[1])
+        return (p2[0]-p1[0],p2[1]-p1[1],p2[2]-p1[2])
 
     def gotNewData(self, result):
+        # the current query was aborted (viewport changed, new push pending):
+        # don't spend a render on a stale refinement
+        if getattr(self.aborted, 'value', False):
+            return
+        # batch the per-refinement widget writes into one document patch
+        self.hold()
+        try:
+            self._gotNewData(result)
+        finally:
+            self.unhold()
+
+    def _gotNewData(self, result):
         data=result['data']
 
         # --- north-up rendering: flip latitude for display only ---
+        # the flip has to be materialized (selection math, zonal stats and the
+        # regional sub-views all index the north-up array), but the target
+        # buffer is reused across frames of the same shape so the per-frame
+        # cost is one memcpy with no allocation
         if data.ndim == 2:
-            data = np.ascontiguousarray(data[::-1, :])
+            buf = self._frame_flip_buf
+            if buf is None or buf.shape != data.shape or buf.dtype != data.dtype:
+                buf = np.empty_like(data)
+                self._frame_flip_buf = buf
+            np.copyto(buf, data[::-1, :])
+            data = buf
+        elif not data.flags['C_CONTIGUOUS']:
+            data = np.ascontiguousarray(data)
 
         try:
-            data_range=np.nanmin(data),np.nanmax(data)
-        except:
+            data_range=NanMinMax(data)
+        except ValueError:
+            # empty tile: nothing sensible to scale against
             data_range=0.0,0.0
 
-        logic_box=result['logic_box'] 
+        logic_box=result['logic_box']
         mode=self.range_mode.value
 
-        maxh=self.db.getMaxResolution()
-        dir=self.direction.value
-        pdim=self.getPointDim()
-        vt,vs=self.logic_to_physic[dir] if pdim==3 else (0.0,1.0)
+        maxh=self.getMaxResolution()
         endh=result['H']
 
-        user_physic_offset=self.offset.value
-        real_logic_offset=logic_box[0][dir] if pdim==3 else 0.0
-        real_physic_offset=vs*real_logic_offset + vt 
-        user_logic_offset=int((user_physic_offset-vt)/vs)
+        # refinements of the same query only change data/H/msec: skip the
+        # invariant widget updates (offset label, axis labels) for those
+        query_key=(result['timestep'], result['field'], tuple(map(tuple, logic_box)), self.direction.value)
+        is_new_query = query_key != self._last_query_key
 
-        self.offset.name=" ".join([
-            f"Offset: {user_physic_offset:.3f}±{abs(user_physic_offset-real_physic_offset):.3f}",
-            f"Pixel: {user_logic_offset}±{abs(user_logic_offset-real_logic_offset)}",
-            f"Max Res: {endh}/{maxh}"
-        ])
+        if is_new_query:
+            dir=self.direction.value
+            pdim=self.getPointDim()
+            vt,vs=self.logic_to_physic[dir] if pdim==3 else (0.0,1.0)
+
+            user_physic_offset=self.offset.value
+            real_logic_offset=logic_box[0][dir] if pdim==3 else 0.0
+            real_physic_offset=vs*real_logic_offset + vt
+            user_logic_offset=int((user_physic_offset-vt)/vs)
+
+            self.offset.name=" ".join([
+                f"Offset: {user_physic_offset:.3f}±{abs(user_physic_offset-real_physic_offset):.3f}",
+                f"Pixel: {user_logic_offset}±{abs(user_logic_offset-real_logic_offset)}",
+                f"Max Res: {endh}/{maxh}"
+            ])
 
         if mode=="dynamic":
             self.range_min.value = round(data_range[0],6)
@@ -1187,33 +1506,44 @@ class Slice(param.Parameterized):
             palette=self.palette.value
             mapper_low =max(EPSILON, low ) if is_log else low
             mapper_high=max(EPSILON, high) if is_log else high
-            self.color_bar = bokeh.models.ColorBar(color_mapper = 
-                bokeh.models.LogColorMapper   (palette=palette, low=mapper_low, high=mapper_high) if is_log else 
+            self.color_bar = bokeh.models.ColorBar(color_mapper =
+                bokeh.models.LogColorMapper   (palette=palette, low=mapper_low, high=mapper_high) if is_log else
                 bokeh.models.LinearColorMapper(palette=palette, low=mapper_low, high=mapper_high)
             )
-
-        self.canvas.showData(data, self.toPhysic(logic_box), color_bar=self.color_bar)
-        self.stats_view.set_data(data)
-        try:
-            regional_raw=data[int(self.selected_logic_box[0][1]):int(self.selected_logic_box[1][1]),
-                               int(self.selected_logic_box[0][0]):int(self.selected_logic_box[1][0])]
-            regional_data = np.ascontiguousarray(regional_raw[::-1, :])
-
-            if self.region_checkbox.value:
-                self.region_view.set_latlon(regional_data)
-            if self.region_stats_panel.visible==True:
-                self.region_stats_view.set_data(regional_data)
-        except: 
-            pass
-
-        (X,Y,Z),(tX,tY,tZ)=self.getLogicAxis()
-        self.canvas.setAxisLabels(tX,tY)
+        else:
+            # range churn (dynamic modes): mutate the mapper in place rather
+            # than recreating the ColorBar model
+            cm=self.color_bar.color_mapper
+            if isinstance(cm, bokeh.models.LogColorMapper):
+                mapper_low, mapper_high=max(EPSILON, low), max(EPSILON, high)
+            else:
+                mapper_low, mapper_high=low, high
+            if cm.low!=mapper_low:  cm.low =mapper_low
+            if cm.high!=mapper_high: cm.high=mapper_high
+
+        self.canvas.showData(data, self._cachedToPhysic(logic_box), color_bar=self.color_bar)
+        if self.stats_view is not None:
+            self.stats_view.set_data(data)
+        sel=self._sel_ix
+        if sel is not None and data.ndim==2:
+            (x0,y0),(x1,y1)=sel
+            if y1>y0 and x1>x0:
+                regional_data=np.ascontiguousarray(data[y0:y1, x0:x1][::-1, :])
+                if self.region_checkbox.value and self.region_view is not None:
+                    self.region_view.set_latlon(regional_data)
+                if self.region_stats_panel.visible==True and self.region_stats_view is not None:
+                    self.region_stats_view.set_data(regional_data)
+
+        if is_new_query:
+            (X,Y,Z),(tX,tY,tZ)=self.getLogicAxis()
+            self.canvas.setAxisLabels(tX,tY)
+            self._last_query_key=query_key
 
         self.H=result['H']
         query_status="running" if result['running'] else "FINISHED"
         self.response.value=" ".join([
             f"#{result['I']+1}",
-            f"{str(logic_box).replace(' ','')}",
+            _fmt_box(logic_box),
             str(data.shape),
             f"Res={result['H']}/{maxh}",
             f"{result['msec']}msec",
@@ -1235,10 +1565,10 @@ class Slice(param.Parameterized):
         self.query_node2.waitIdle()
         num_refinements = self.num_refinements.value
         if num_refinements==0:
-            num_refinements={1: 1, 2: 3, 3: 4}[pdim]
+            num_refinements=_NUM_REFINEMENTS_BY_PDIM[pdim]
         self.aborted=Aborted()
 
-        if (time.time()-self.last_job_pushed)<0.2:
+        if (time.monotonic_ns()-self.last_job_pushed_ns)<200_000_000:
             return
 		
         if not self.view_dependent.value:
@@ -1252,43 +1582,46 @@ class Slice(param.Parameterized):
             if pdim==1:
                 max_pixels=canvas_w
             else:
-                delta=self.resolution.value-self.getMaxResolution()
-                if self.resolution.value==self.getMaxResolution():
-                    coeff=1.0
-                elif self.resolution.value<self.getMaxResolution():
-                    coeff=1.0/pow(1.3,abs(delta))
-                else:
-                    coeff=1.0*pow(1.3,abs(delta))
+                # negative delta naturally gives the decrease branch
+                delta=int(self.resolution.value-self.getMaxResolution())
+                coeff=_POW13[delta+32]
                 max_pixels=int(canvas_w*canvas_h*coeff)
 			
-        self.scene_body.value=json.dumps(self.getSceneBody(),indent=2)
+        # serialize the scene body only when the Open dialog has a viewer
+        # for it and the body actually changed
+        if self._scene_body_watched:
+            body=self.getSceneBody()
+            body_id=hash(repr(body))
+            if body_id!=self._last_scene_body_id:
+                self.scene_body.value=_json_dumps(body,indent=2)
+                self._last_scene_body_id=body_id
         timestep=int(self.timestep.value)
         field="2T"  # the only field
 
         box_i=[[int(it) for it in jt] for jt in query_logic_box]
-        self.request.value=f"t={timestep} b={str(box_i).replace(' ','')} {canvas_w}x{canvas_h}"
+        self.request.value=f"t={timestep} b={_fmt_box(box_i)} {canvas_w}x{canvas_h}"
         self.response.value="Running..."
 
-        self.query_node.pushJob(
-            self.db, 
-            access=self.access,
-            timestep=timestep, 
-            field=field, 
-            logic_box=query_logic_box, 
-            max_pixels=max_pixels, 
-            num_refinements=num_refinements, 
-            endh=endh, 
-            aborted=self.aborted
-        )
+        # reuse one kwargs dict across pushes instead of rebuilding it each call
+        push=self._push_kwargs
+        push['access']=self.access
+        push['timestep']=timestep
+        push['field']=field
+        push['logic_box']=query_logic_box
+        push['max_pixels']=max_pixels
+        push['num_refinements']=num_refinements
+        push['endh']=endh
+        push['aborted']=self.aborted
+        self.query_node.pushJob(self.db, **push)
 		
-        self.last_job_pushed=time.time()
+        self.last_job_pushed_ns=time.monotonic_ns()
         self.new_job=False
 
     # ----- Selection details dialog -----
     def showDetails(self,evt=None):
         import openvisuspy as ovy
 
-        self.region_view.reset_view()
+        self.getRegionView().reset_view()
         x,y,w,h=evt.new
         z=int(self.offset.value)
         y_view_min = self.canvas.fig.y_range.start
@@ -1298,121 +1631,125 @@ class Slice(param.Parameterized):
         # Use the inverted-Y viewport for logic mapping / query
         logic_box = self.toLogic([x, y_inv, w, h])
         self.logic_box=logic_box
-        print(f'---------------------SELECTED LOGIC BOX---------------- . {self.logic_box}')
-        data=list(ovy.ExecuteBoxQuery(self.db, access=self.db.createAccess(), field=self.field.value,
-                                      timestep=self.timestep.value,logic_box=logic_box,num_refinements=1))[0]["data"]
+        logger.debug("selected logic box %s", self.logic_box)
+        # realize only the first refinement and reuse the cached access
+        data=next(iter(ovy.ExecuteBoxQuery(self.db, access=self._details_access, field=self.field.value,
+                                           timestep=self.timestep.value,logic_box=logic_box,num_refinements=1)))["data"]
+        # one cast to C-contiguous float32, shared by the reductions, the
+        # dialog image and save_data (halves wire bytes vs float64)
+        if data.dtype!=np.float32 or not data.flags['C_CONTIGUOUS']:
+            data=np.ascontiguousarray(data, dtype=np.float32)
         self.selected_logic_box=self.logic_box
+        # integer slice indices, converted once per selection instead of per frame
+        self._sel_ix=np.asarray(self.selected_logic_box, dtype=np.int64)[:, :2]
         self.selected_physic_box=[[x,x+w],[y,y+h]]
        
         self.detailed_data=data
 
-        # north-up in popup too
-        data_flipped = np.ascontiguousarray(data[::-1, :])
-        save_numpy_button = pn.widgets.Button(name='Save Data as Numpy', button_type='primary')
-        download_script_button = pn.widgets.Button(name='Download Script', button_type='primary')
-        apply_colormap_button = pn.widgets.Button(name='Replace Existing Range', button_type='primary')
-        apply_min_colormap_button = pn.widgets.Button(name='Replace Min Range', button_type='primary')
-        apply_max_colormap_button = pn.widgets.Button(name='Replace Max Range', button_type='primary')
-        apply_avg_min_colormap_button = pn.widgets.Button(name='Apply Average Min', button_type='primary')
-        apply_avg_max_colormap_button = pn.widgets.Button(name='Apply Average Max', button_type='primary')
-
-        save_numpy_button.on_click(self.save_data)
-        download_script_button.on_click(self.download_script)
-        apply_colormap_button.on_click(self.apply_cmap)
-        apply_max_colormap_button.on_click(self.apply_max_cmap)
-        apply_min_colormap_button .on_click(self.apply_min_cmap)
-        apply_avg_max_colormap_button.on_click(self.apply_avg_max_cmap)
-        apply_avg_min_colormap_button .on_click(self.apply_avg_min_cmap)
-
-        self.vmin,self.vmax=np.nanmin(data),np.nanmax(data)
-        add_range_button=pn.widgets.Button(name='Add This Range',button_type='primary')
-        add_range_button.on_click(self.add_range)
+        # north-up in popup too; reuse the flip buffer across selections of the same shape
+        buf = self._detail_image_buf
+        if buf is None or buf.shape != data.shape or buf.dtype != data.dtype:
+            buf = np.empty_like(data)
+            self._detail_image_buf = buf
+        np.copyto(buf, data[::-1, :])
+        data_flipped = buf
+
+        # one reduction pass, reused for the color mapper below
+        self.vmin,self.vmax=NanMinMax(data)
 
         if self.range_mode.value=="dynamic-acc":
-            self.vmin,self.vmax=np.nanmin(data),np.nanmax(data)
             self.range_min.value = min(self.range_min.value, self.vmin)
             self.range_max.value = max(self.range_max.value, self.vmax)
             logger.info(f"Updating range with selected area vmin={self.vmin} vmax={self.vmax}")
 
-        p = figure(x_range=(self.selected_physic_box[0][0], self.selected_physic_box[0][1]),
-                   y_range=(self.selected_physic_box[1][0], self.selected_physic_box[1][1]))
-        palette_name = self.palette.value_name if self.palette.value_name.endswith("256") else "Turbo256"
-        mapper = LinearColorMapper(palette=palette_name, low=np.nanmin(data_flipped), high=np.nanmax(data_flipped))
-        source = ColumnDataSource(data=dict(image=[data_flipped]))
-        dw = abs(self.selected_physic_box[0][1] -self.selected_physic_box[0][0])
-        dh = abs(self.selected_physic_box[1][1] - self.selected_physic_box[1][0])
-        p.image(image='image', x=self.selected_physic_box[0][0], y=self.selected_physic_box[1][0], dw=dw, dh=dh,
-                color_mapper=mapper, source=source)  
-        self.region_view.reset_view()
-        self.region_view.set_latlon(data_flipped, self.selected_physic_box[0][0], self.selected_physic_box[1][0], dw, dh)
-
-        try: self.region_stats_view.set_data(data_flipped) 
-        except: pass
-
-        color_bar = ColorBar(color_mapper=mapper, label_standoff=12, location=(0,0))
-        p.add_layout(color_bar, 'right')
-        p.xaxis.axis_label = "Longitude"
-        p.yaxis.axis_label = "Latitude"
+        (x_lo,x_hi),(y_lo,y_hi)=self.selected_physic_box
+        dw = abs(x_hi - x_lo)
+        dh = abs(y_hi - y_lo)
+        palette_name = self._palette256
 
-        self.showDialog(
-            pn.Column(
-                self.file_name_input, 
-                pn.Row(save_numpy_button,download_script_button),
-                pn.Row(pn.pane.Bokeh(p), pn.Column(
-                    pn.pane.Markdown(f"#### Palette Used: {palette_name}"),
-                    pn.pane.Markdown(f"#### New Min/Max Found"),
-                    pn.pane.Markdown(f"**Min:** {self.vmin}, **Max:** {self.vmax}"),
-                    pn.Row(apply_avg_min_colormap_button,apply_avg_max_colormap_button),
-                    add_range_button,
-                    apply_colormap_button)),
-                sizing_mode="stretch_both"
-            ), 
-            width=1048, height=748, name="Details"
-        )
+        # update the persistent dialog models in place
+        self._detail_source.data = dict(image=[data_flipped], x=[x_lo], y=[y_lo], dw=[dw], dh=[dh])
+        self._detail_mapper.palette = palette_name
+        self._detail_mapper.low, self._detail_mapper.high = self.vmin, self.vmax
+        self._detail_fig.x_range.start, self._detail_fig.x_range.end = x_lo, x_hi
+        self._detail_fig.y_range.start, self._detail_fig.y_range.end = y_lo, y_hi
+        self._detail_palette_md.object = f"#### Palette Used: {palette_name}"
+        self._detail_minmax_md.object  = f"**Min:** {self.vmin}, **Max:** {self.vmax}"
+
+        self.region_view.set_latlon(data_flipped, x_lo, y_lo, dw, dh)
+
+        if self.region_stats_view is not None:
+            try: self.region_stats_view.set_data(data_flipped, stats=(self.vmin, self.vmax))
+            except: pass
+
+        # the same layout can have only one live dialog: drop the stale one
+        self.dialogs[:] = [d for d in self.dialogs if getattr(d, "name", "") != "Details"]
+        self.showDialog(self._detail_layout, width=1048, height=748, name="Details")
 
     # ----- Range apply helpers -----
+    # each handler writes several range widgets whose watchers rebuild the
+    # colormap; hold the document so they land as one downstream update
     def apply_min_cmap(self,event):
-        self.range_min.value=self.vmin
-        self.range_mode.value="user"
+        self.hold()
+        try:
+            self.range_min.value=self.vmin
+            self.range_mode.value="user"
+        finally:
+            self.unhold()
         ShowInfoNotification('New min range applied successfully')
 
     def add_range(self,event):
-        if self.range_max.value<self.vmax:
-            self.range_max.value=self.vmax
-        if self.range_min.value>self.vmin:
-            self.range_min.value=self.vmin
+        self.hold()
+        try:
+            self.range_max.value=max(self.range_max.value,self.vmax)
+            self.range_min.value=min(self.range_min.value,self.vmin)
+        finally:
+            self.unhold()
         ShowInfoNotification('Range Added successfully')
-     
+
     def apply_max_cmap(self,event):
-        self.range_max.value=self.vmax
-        self.range_mode.value="user"
+        self.hold()
+        try:
+            self.range_max.value=self.vmax
+            self.range_mode.value="user"
+        finally:
+            self.unhold()
         ShowInfoNotification('New max range applied successfully')
-  
+
     def apply_avg_min_cmap(self,event):
-        new_avg_min=(self.range_min.value+self.vmin)/2
-        self.range_min.value=round(new_avg_min, 4)
-        self.range_mode.value="user"
+        self.hold()
+        try:
+            self.range_min.value=round((self.range_min.value+self.vmin)/2, 4)
+            self.range_mode.value="user"
+        finally:
+            self.unhold()
         ShowInfoNotification('Average Min range applied successfully')
 
     def apply_avg_max_cmap(self,event):
-        new_avg_max=(self.range_max.value+self.vmax)/2
-        self.range_max.value=round(new_avg_max, 4)
-        self.range_mode.value="user"
+        self.hold()
+        try:
+            self.range_max.value=round((self.range_max.value+self.vmax)/2, 4)
+            self.range_mode.value="user"
+        finally:
+            self.unhold()
         ShowInfoNotification('Average Max range applied successfully')
-  
+
     def apply_cmap(self,event):
-        self.range_min.value=self.vmin
-        self.range_max.value=self.vmax
-        self.range_mode.value="user"
+        self.hold()
+        try:
+            self.range_min.value=self.vmin
+            self.range_max.value=self.vmax
+            self.range_mode.value="user"
+        finally:
+            self.unhold()
         ShowInfoNotification('New Colormap Range applied successfully')
         self.refresh()
 
     def download_script(self,event):
         url=self.data_url
-        rounded_logic_box = [
-            [int(self.logic_box[0][0]), int(self.logic_box[0][1]), self.logic_box[0][2]],
-            [int(self.logic_box[1][0]), int(self.logic_box[1][1]), self.logic_box[1][2]]
-        ]
+        (x0,y0,z0),(x1,y1,z1)=self.logic_box
+        x0,y0,x1,y1=int(x0),int(y0),int(x1),int(y1)
+        rounded_logic_box=[[x0,y0,z0],[x1,y1,z1]]
         python_file_content = f"""
 import OpenVisus
 import numpy as np
@@ -1422,19 +1759,41 @@ db=OpenVisus.LoadDataset(data_url)
 data=db.read(time={self.timestep.value},logic_box={rounded_logic_box})
 np.savez('selected_data',data=data)
 """
-        file_path = f'./download_script_{rounded_logic_box[0][0]}_{rounded_logic_box[0][1]}.py'
-        with open(file_path, 'w') as file:
-            file.write(python_file_content)
-        ShowInfoNotification('Script to download selected data saved!')
-        print("Script saved successfully.") 
+        file_path = f'./download_script_{x0}_{y0}.py'
+        fut=self._io_pool.submit(SaveFile, file_path, python_file_content)
+        fut.add_done_callback(self._notifyWhenWritten('Script to download selected data saved!'))
 
     def save_data(self, event):
         if self.detailed_data is not None:
             file_name = f"{self.file_name_input.value}.npz" if self.file_name_input.value else "test_region.npz"
-            np.savez(file_name, data=self.detailed_data, lon_lat=self.selected_physic_box)
-            ShowInfoNotification('Data Saved successfully to current directory!')
+            fut=self._io_pool.submit(self._write_selection, file_name, self.detailed_data, self.selected_physic_box)
+            fut.add_done_callback(self._notifyWhenWritten('Data Saved successfully to current directory!'))
         else:
-            print("No data to save.")
+            logger.debug("No data to save.")
+
+    def _notifyWhenWritten(self, msg):
+        # notify only once the background write finished; the callback runs on
+        # the worker thread, so hop back onto the document for the toast
+        doc=pn.state.curdoc
+        def _done(fut):
+            err=fut.exception()
+            text=msg if err is None else f"Write failed: {err}"
+            if err is not None:
+                logger.error(f"background write failed: {err}")
+            if doc is not None:
+                doc.add_next_tick_callback(lambda: ShowInfoNotification(text))
+            else:
+                ShowInfoNotification(text)
+        return _done
+
+    def _write_selection(self, file_name, data, lon_lat):
+        # stream each array straight into the zip; np.savez would first build
+        # an in-memory buffer the size of the data, doubling peak RSS
+        with zipfile.ZipFile(file_name, 'w', zipfile.ZIP_STORED, allowZip64=True) as zf:
+            with zf.open('data.npy', 'w', force_zip64=True) as f:
+                np.lib.format.write_array(f, np.asarray(data), allow_pickle=False)
+            with zf.open('lon_lat.npy', 'w') as f:
+                np.lib.format.write_array(f, np.asarray(lon_lat), allow_pickle=False)
 
     # ----- Idle loop -----
     def onIdle(self):
@@ -1442,24 +1801,14 @@ np.savez('selected_data',data=data)
             return
 
         self.canvas.onIdle()
-        if self.canvas and self.canvas.getWidth()>0 and self.canvas.getHeight()>0:
+        # hoisted is_playing check: skip the call entirely in the idle common case
+        if self.play.is_playing and self.canvas.getWidth()>0 and self.canvas.getHeight()>0:
             self.playNextIfNeeded()
 
         if self.query_node:
             result=self.query_node.popResult(last_only=True) 
-            if result is not None: 
+            if result is not None:
+                # stats/regional updates happen inside gotNewData already
                 self.gotNewData(result)
-                self.stats_view.set_data(result['data'])
-                try:
-                    regional_raw=result['data'][int(self.selected_logic_box[0][1]):int(self.selected_logic_box[1][1]),
-                                                 int(self.selected_logic_box[0][0]):int(self.selected_logic_box[1][0])]
-                    regional_data = np.ascontiguousarray(regional_raw[::-1, :])
-
-                    if self.region_checkbox.value:
-                        self.region_view.set_latlon(regional_data)
-                    if self.region_stats_panel.visible==True:
-                        self.region_stats_view.set_data(regional_data)
-                except: 
-                    pass
             self.pushJobIfNeeded()
 
@@ -3,6 +3,8 @@ from bokeh.plotting import figure
 from bokeh.models import ColumnDataSource, HoverTool
 import panel as pn
 
+from .utils import NanMinMax
+
 class StatsView:
     def __init__(self):
         self.source_general = ColumnDataSource(data=dict(x=[], y=[], label=[]))
@@ -57,10 +59,11 @@ class StatsView:
                                           value="General Stats")
         self.dropdown.param.watch(self.update_plot_based_on_selection, 'value')
 
-        self.current_model_data = None    
-        self.multi_model_data = None      
-        self.time_step = 0  
+        self.current_model_data = None
+        self.multi_model_data = None
+        self.time_step = 0
         self.first_average = None
+        self._cached_stats = None
 
         self.view = pn.Column(self.dropdown, sizing_mode="stretch_both")
         self.view.append(self.get_plot_view())
@@ -68,8 +71,11 @@ class StatsView:
     def set_data(self, current_model_data, multi_model_data=None):
         self.current_model_data = current_model_data
         self.multi_model_data = multi_model_data
+        # one reduction sweep per frame, shared by the general-stats plot below
+        min_value, max_value = NanMinMax(current_model_data)
+        avg_value = np.nanmean(current_model_data)
+        self._cached_stats = (min_value, max_value, avg_value)
         self.update_plot_based_on_selection()
-        avg_value = np.nanmean(self.current_model_data)
         if self.first_average is None:
             self.first_average = avg_value
             self.avg_plot.y_range.start = self.first_average - 10
@@ -91,8 +97,9 @@ class StatsView:
     def calculate_general_stats(self):
         if self.current_model_data is None:
             return None
-        min_value = np.nanmin(self.current_model_data)
-        max_value = np.nanmax(self.current_model_data)
+        if self._cached_stats is not None:
+            return self._cached_stats
+        min_value, max_value = NanMinMax(self.current_model_data)
         avg_value = np.nanmean(self.current_model_data)
         return min_value, max_value, avg_value
 
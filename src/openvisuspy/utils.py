@@ -14,8 +14,6 @@ COLORS = ["lime", "red", "green", "yellow", "orange", "silver", "aqua", "pink",
 
 DEFAULT_PALETTE="Turbo256"
 
-import colorcet
-
 import bokeh
 import bokeh.core
 import bokeh.core.validation
@@ -295,6 +293,21 @@ def SetupJupyterLogger(
 	return logger
 
 
+# ///////////////////////////////////////////////////
+# optional fast reductions (bottleneck has contiguous-2D specializations)
+try:
+	import bottleneck as _bn
+except ImportError:
+	_bn = None
+
+def NanMinMax(data):
+	# integer arrays cannot hold NaNs: plain min/max skips the NaN-aware pass
+	if data.dtype.kind not in 'fc':
+		return data.min(), data.max()
+	if _bn is not None:
+		return _bn.nanmin(data), _bn.nanmax(data)
+	return np.nanmin(data), np.nanmax(data)
+
 # ///////////////////////////////////////////////////
 def SplitChannels(array):
 	return [array[...,C] for C in range(array.shape[-1])]
@@ -351,9 +364,10 @@ def ConvertDataForRendering(data, normalize_float=True):
 		
 	else:
 
-		# (height,depth) ... I will apply matplotlib colormap 
+		# (height,depth) ... I will apply matplotlib colormap
 		if len(data.shape)==2:
-			G=data.astype(np.float32)
+			# copy=False: float32 input (the common render path) passes through untouched
+			G=data.astype(np.float32, copy=False)
 			return G
 		
 		# (height,depth,channel)
@@ -367,7 +381,7 @@ def ConvertDataForRendering(data, normalize_float=True):
 		if normalize_float:
 			for C,channel in enumerate(channels):
 				m,M=np.min(channel),np.max(channel)
-				channels[C]=(channel-m)/(M-m)
+				channels[C]=(channel-m)*(np.float32(1.0)/(M-m))
 
 		if len(channels)==1:
 			G=channels[0]
@@ -392,7 +406,15 @@ def ConvertDataForRendering(data, normalize_float=True):
 
 
 # ///////////////////////////////////////////////////
+_PALETTES_CACHE=None
+
 def GetPalettes():
+	# built once per process; the palette lists are immutable and shared
+	# by every Slice instance (and re-handed to Bokeh by reference)
+	global _PALETTES_CACHE
+	if _PALETTES_CACHE is not None:
+		return _PALETTES_CACHE
+	import colorcet # deferred, it's slow to import and only needed here
 	ret = {}
 	for name in bokeh.palettes.__palettes__:
 		value=getattr(bokeh.palettes,name,None)
@@ -406,6 +428,7 @@ def GetPalettes():
 			if len(name)>12: continue
 			ret[name]=value
 
+	_PALETTES_CACHE=ret
 	return ret
 
 # ////////////////////////////////////////////////////////